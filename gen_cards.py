@@ -1,14 +1,28 @@
 from PIL import Image, ImageDraw, ImageFont, ImageOps
+import numpy as np
 import os
-import requests
 import json
+import requests
+import ijson
+import itertools
+import hashlib
+import logging
 from io import BytesIO
 from datetime import date
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+
+log = logging.getLogger(__name__)
 
 # --- Configuration ---
 TEMPLATE_PATH = 'template.png'
 OUTPUT_DIR = 'cards'
 FONT_PATH = 'fonts/Arimo-VariableFont_wght.ttf' # Path to a .ttf font file (e.g., download from Google Fonts or use one installed on your OS)
+DOWNLOAD_WORKERS = 32 # Concurrent connections used to pull face images
+FACE_CACHE_DIR = '.cache/faces' # Downloaded face images, named by sha1 of their URL
+MANIFEST_PATH = os.path.join(OUTPUT_DIR, '.manifest.json') # bioguideID -> fingerprint of the data each card was made from
+CARD_LAYOUT_VERSION = 1 # Bump when the card layout changes so every card in the manifest is redrawn
+PNG_COMPRESS_LEVEL = 1 # zlib level for saved cards, 1 encodes several times faster than the default 6 for slightly bigger files
 
 # All coordinates are (x, y) from the top-left corner of the image.
 CARD_DIMS = (1080, 1920)
@@ -31,41 +45,135 @@ FONT_SIZES = {
     'labels': 40
 }
 
+CURRENT_YEAR = date.today().year
+
+# Stats text templates, picked by when the rep is next up for election
+MSG_FUTURE = "{chamber}\n{start} - Present\n{tenure} most tenured {party}\nUp for re-election in {reelect}"
+MSG_NOW = "{chamber}\n{start} - Present\n{tenure} most tenured {party}\nUp for re-election this year"
+MSG_PAST = "{chamber}\n{start} - {end}\n{tenure} most tenured {party}\n"
+MSG_TEMPLATES = (MSG_PAST, MSG_NOW, MSG_FUTURE) # Indexed by sign(re-election year - CURRENT_YEAR) + 1
+
+# Text is drawn at this multiple of the card size, then downsampled onto the card for smoother edges.
+# Fonts are loaded pre-scaled; positions and sizes elsewhere stay in card pixels.
+TEXT_SCALE = 2
+TEXT_DIMS = (CARD_DIMS[0] * TEXT_SCALE, CARD_DIMS[1] * TEXT_SCALE)
+
 try:
-    font_name = ImageFont.truetype(FONT_PATH, FONT_SIZES['name'])
-    font_stats = ImageFont.truetype(FONT_PATH, FONT_SIZES['stats'])
-    font_labels = ImageFont.truetype(FONT_PATH, FONT_SIZES['labels'])
+    font_name = ImageFont.truetype(FONT_PATH, FONT_SIZES['name'] * TEXT_SCALE)
+    font_stats = ImageFont.truetype(FONT_PATH, FONT_SIZES['stats'] * TEXT_SCALE)
+    font_labels = ImageFont.truetype(FONT_PATH, FONT_SIZES['labels'] * TEXT_SCALE)
 except IOError:
     print(f"Warning: Could not load font from {FONT_PATH}. Using default Pillow font. "
         "Ensure the font file exists and is accessible.")
-    font_name = ImageFont.load_default()
-    font_stats = ImageFont.load_default()
-    font_labels = ImageFont.load_default()
+    font_name = ImageFont.load_default(size=FONT_SIZES['name'] * TEXT_SCALE)
+    font_stats = ImageFont.load_default(size=FONT_SIZES['stats'] * TEXT_SCALE)
+    font_labels = ImageFont.load_default(size=FONT_SIZES['labels'] * TEXT_SCALE)
+
+_TEMPLATE = None # Decoded RGBA template, loaded once per process by load_template
 
 ######################################################################################
 
-def center_text(draw, text, font, text_color, offset=(0,0), center=(True,True)):
+def center_text(draw, text, font, text_color, offset=(0,0), center=(True,True), dims=CARD_DIMS):
 
     _, _, w, h = draw.textbbox((0,0), text=text, font=font)
     #image_width, image_height = card.size
     if center[0]:
-        x_text = ((CARD_DIMS[0] - offset[0] - w) / 2 ) + offset[0]
+        x_text = ((dims[0] - offset[0] - w) / 2 ) + offset[0]
     else: 
         x_text = offset[0]
     if center[1]:
-        y_text = ((CARD_DIMS[1] - offset[1] - h) / 2 ) + offset[1]
+        y_text = ((dims[1] - offset[1] - h) / 2 ) + offset[1]
 
     else:
         y_text = offset[1]
     draw.text((x_text, y_text), text=text, font=font, fill=text_color)
 
-def pull_pic_from_web(rep, error_log):
+def face_cache_path(url):
+    """
+    Args:
+        url (str): Face image URL
+    Returns:
+        (str): Where the image for url is cached
+    """
+    return os.path.join(FACE_CACHE_DIR, hashlib.sha1(url.encode()).hexdigest())
+
+
+def prefetch_faces(congressmen_json, use_cache=True):
+    """
+    Downloads every rep's face image up front, over a pooled session with
+    many connections in flight, so no card waits on the network.
+    Reps can be streamed in, each download starts as soon as its rep is read.
+    Images are kept in FACE_CACHE_DIR so later runs can skip the download.
+
+    Args:
+        congressmen_json (iterable): Rep info dictionaries, e.g. streamed by ijson
+        use_cache (bool): Reuse cached images. If False, everything is re-downloaded and the cache refreshed.
+    Returns:
+        (list): The reps that were read, in order
+        (dict): Image bytes keyed by URL, None where the download failed
+    """
+    reps = []
+    futures = {}
+
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(pool_connections=DOWNLOAD_WORKERS, pool_maxsize=DOWNLOAD_WORKERS))
+
+    def fetch(url):
+        cache_path = face_cache_path(url)
+        if use_cache and os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as f:
+                    return f.read()
+            except OSError as e:
+                log.warning("Could not read cached face image %s, downloading it again: %s", cache_path, e)
+
+        try:
+            response = session.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.exceptions.RequestException as e:
+            log.warning("Could not download face image at URL %s: %s", url, e)
+            return None
+
+        # Only cache bytes that are actually an image, an error page would otherwise be reused every run
+        try:
+            Image.open(BytesIO(response.content)).verify()
+        except Exception as e:
+            log.warning("Face image at URL %s is not a readable image: %s", url, e)
+            return None
+
+        # Write then rename so an interrupted run never leaves a partial image behind.
+        # A cache that can't be written only costs a download next run, the image is still used.
+        try:
+            with open(cache_path + '.tmp', 'wb') as f:
+                f.write(response.content)
+            os.replace(cache_path + '.tmp', cache_path)
+        except OSError as e:
+            log.warning("Could not cache face image at URL %s: %s", url, e)
+        return response.content
+
+    try:
+        os.makedirs(FACE_CACHE_DIR, exist_ok=True)
+    except OSError as e:
+        log.warning("Could not create face image cache %s: %s", FACE_CACHE_DIR, e)
+    with session, ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        for rep in congressmen_json:
+            reps.append(rep)
+            url = rep.get('imageUrl')
+            if url and "http" in url and url not in futures:
+                futures[url] = ex.submit(fetch, url)
+        print(f"Fetching {len(futures)} face images")
+        images = {url: future.result() for url, future in futures.items()}
+    return reps, images
+
+
+def pull_pic_from_web(rep, face_bytes, error_log):
     """
     Pull the photo from the web link. 
     If no link was given, fill with an empty photo.
     
     Args:
         rep (dict): Dictionary with rep info 
+        face_bytes (bytes): Image downloaded from rep['imageUrl'] by prefetch_faces, None if missing
     Returns:
         (img): Image of rep's face
     """
@@ -73,18 +181,35 @@ def pull_pic_from_web(rep, error_log):
     try:
         face_path = rep['imageUrl']
         if face_path is None:
-            print (f"No image found. Creating dummy face image.")
+            log.debug("No image found. Creating dummy face image.")
             img = Image.new('RGB', PIC_MAX, color = 'lightgray')
             str_err = rep['name'] + "Face Image Not Found"
             error_log.append(str_err)
 
         elif "http" in face_path:
-            #Pull from web source
-            print(f"Found face image at URL {face_path}. Saving.")
-            face_path_url = requests.get(face_path)
-            img = Image.open(BytesIO(face_path_url.content))
+            #Already pulled from web source by prefetch_faces
+            if face_bytes is None:
+                log.debug("Couldn't download face image at URL %s. Creating dummy face image.", face_path)
+                img = Image.new('RGB', PIC_MAX, color = 'lightgray')
+                str_err = rep['name'] + "Face Image Download"
+                error_log.append(str_err)
+            else:
+                log.debug("Found face image at URL %s. Saving.", face_path)
+                try:
+                    img = Image.open(BytesIO(face_bytes))
+                    img.load()
+                except (Image.UnidentifiedImageError, OSError) as e:
+                    log.debug("Couldn't decode face image at URL %s: %s. Creating dummy face image.", face_path, e)
+                    img = Image.new('RGB', PIC_MAX, color = 'lightgray')
+                    str_err = rep['name'] + "Face Image Decode"
+                    error_log.append(str_err)
+                    # Drop the cached copy so the next run downloads it again
+                    try:
+                        os.remove(face_cache_path(face_path))
+                    except OSError:
+                        pass
         else:
-            print (f"Not sure what format this photo is in: {face_path}. Creating dummy face image.")
+            log.debug("Not sure what format this photo is in: %s. Creating dummy face image.", face_path)
             img = Image.new('RGB', PIC_MAX, color = 'lightgray')
             str_err = rep['name'] + "Face Image Format"
             error_log.append(str_err)
@@ -99,6 +224,69 @@ def pull_pic_from_web(rep, error_log):
     return img
 
 
+_FONT_ADVANCES = {}
+_LINE_HEIGHTS = {} # Base line height per font, keyed like _FONT_ADVANCES
+
+def font_advances(font):
+    """
+    Looks up (and caches) the advance width of every latin-1 character for a font.
+
+    Args:
+        font (ImageFont.FreeTypeFont): The font to measure with.
+    Returns:
+        (np.ndarray): float32 array of 256 advances, indexed by character code.
+    """
+    advances = _FONT_ADVANCES.get(id(font))
+    if advances is None:
+        advances = np.array([font.getlength(chr(c)) for c in range(256)], dtype=np.float32)
+        _FONT_ADVANCES[id(font)] = advances
+    return advances
+
+
+def wrap_paragraph(para, font, max_width):
+    """
+    Greedily wraps a single paragraph (no "\n") on word boundaries.
+
+    Character advances come from a cached per-font table, so the running width
+    of the paragraph is one cumsum and each wrap point is a searchsorted lookup
+    rather than a call into FreeType.
+
+    Args:
+        para (str): The paragraph to wrap.
+        font (ImageFont.FreeTypeFont): The font to measure with.
+        max_width (int): The maximum width of a line in pixels.
+    Returns:
+        (list): The wrapped lines. An empty paragraph gives a single empty line.
+    """
+    # Characters outside latin-1 are measured as "?"
+    ords = np.frombuffer(para.encode('latin-1', 'replace'), dtype=np.uint8)
+    # cum[j] - cum[i] is the width of para[i:j]
+    cum = np.concatenate(([0], np.cumsum(np.take(font_advances(font), ords))))
+    spaces = np.where(ords == 32)[0]
+
+    lines = []
+    i, n = 0, len(para)
+
+    while i < n:
+        # Furthest end that still fits, but always take at least one character
+        j = int(np.searchsorted(cum, cum[i] + max_width, side='right')) - 1
+        j = max(j, i + 1)
+
+        # Back off to the last space so words are never split
+        if j < n and ords[j] != 32:
+            k = int(np.searchsorted(spaces, j))
+            if k > 0 and spaces[k - 1] > i:
+                j = int(spaces[k - 1])
+            else:
+                # A single word wider than the box gets a line to itself
+                j = int(spaces[k]) if k < len(spaces) else n
+
+        lines.append(para[i:j])
+        i = j + 1 # Skip the space we broke on
+
+    return lines or ['']
+
+
 def draw_wrapped_text(draw_context, text, font, xy, max_width, fill_color=(0, 0, 0), extra_padding_for_newline=10):
     """
     Draws text with automatic wrapping and handles existing newline characters,
@@ -114,84 +302,126 @@ def draw_wrapped_text(draw_context, text, font, xy, max_width, fill_color=(0, 0,
         extra_padding_for_newline (int): Additional vertical space to add for each "\n".
     """
     x, y = xy
-    all_lines = []
-    
-    # Split the initial text by newlines to handle pre-existing breaks
-    # We use a special marker to distinguish explicit newlines from wrapped lines
-    paragraphs = text.replace('\n', '||NEWLINE||').split('||NEWLINE||')
-
-    for para in paragraphs:
-        lines = []
-        line_words = []
-        words = para.split(' ')
-
-        for word in words:
-            current_line = ' '.join(line_words + [word])
-            # Use textbbox to get accurate width
-            text_bbox = draw_context.textbbox((0, 0), current_line, font=font)
-            line_width = text_bbox[2] - text_bbox[0]
-
-            if line_width > max_width and line_words:
-                lines.append(' '.join(line_words))
-                line_words = [word]
-            else:
-                line_words.append(word)
 
-        if line_words:
-            lines.append(' '.join(line_words))
-            
-        all_lines.extend(lines)
-        # Add a special marker to the list to indicate a manual newline
-        all_lines.append("||MANUAL_NEWLINE||")
+    # Get the base line height, it only depends on the font
+    line_height = _LINE_HEIGHTS.get(id(font))
+    if line_height is None:
+        _, _, _, line_height = draw_context.textbbox((0,0), "A", font=font)
+        _LINE_HEIGHTS[id(font)] = line_height
 
-    # Remove the extra newline at the very end
-    if all_lines and all_lines[-1] == "||MANUAL_NEWLINE||":
-        all_lines.pop()
-
-    # Get the base line height
-    _, _, _, line_height = draw_context.textbbox((0,0), "A", font=font)
-    
-    for line in all_lines:
-        if line == "||MANUAL_NEWLINE||":
+    # Each pre-existing line break starts a paragraph, which is wrapped on its own
+    for i, para in enumerate(text.split('\n')):
+        if i:
             # Add extra space for explicit newlines
             y += extra_padding_for_newline
-        else:
+        for line in wrap_paragraph(para, font, max_width):
             draw_context.text((x, y), line, font=font, fill=fill_color)
             y += line_height * 1.2 # Standard spacing for wrapped lines
 
 
 
-# --- Function to create a single player card ---
-def create_card(rep_info, face_img):
-    
-    # 1. Open the template image
-    card = Image.open(TEMPLATE_PATH).convert("RGBA") # Convert to RGBA for transparency handling
+def load_template():
+    """
+    Opens and decodes the template the first time it is needed, then keeps it
+    in memory. Callers must copy() it before drawing on it.
+
+    Returns:
+        (img): The pristine RGBA template
+    """
+    global _TEMPLATE
+    if _TEMPLATE is None:
+        # convert() fully decodes into memory, so the file can be closed straight away
+        with Image.open(TEMPLATE_PATH) as template:
+            _TEMPLATE = template.convert("RGBA") # Convert to RGBA for transparency handling
+    return _TEMPLATE
+
+
+def card_filename(rep_info):
+    """
+    Args:
+        rep_info (dict): Dictionary with rep info
+    Returns:
+        (str): Path the rep's card is saved to
+    """
+    replacements = str.maketrans({",": "", "\"": "", ".":"", " ":"_"})
+    return os.path.join(OUTPUT_DIR, \
+         f"{rep_info['name'].translate(replacements).lower()}_card.png")
 
-    # 2. Open and process the player's face image
-    #face_img = ImageOps.fit(face_img, PIC_MAX, method=0, bleed=0.0, centering=(0.5, 0.5))
-    face_img = face_img.resize(PIC_MAX) # Resize to desired dimensions
 
-    print("Successfully resized face image")
+def layout_stamp():
+    """
+    Returns:
+        (list): CARD_LAYOUT_VERSION plus the size and mtime of the template and font,
+            so editing either one redraws every card
+    """
+    stamp = [CARD_LAYOUT_VERSION]
+    for path in (TEMPLATE_PATH, FONT_PATH):
+        try:
+            st = os.stat(path)
+            stamp.append([st.st_size, st.st_mtime_ns])
+        except OSError:
+            stamp.append(None)
+    return stamp
 
-    # Paste the face image onto the card
-    card.paste(face_img, box=POSITIONS['pic_pos'])
 
-    # 3. Prepare to draw text
-    draw = ImageDraw.Draw(card)
-    text_color = (0, 0, 0, 255) # Black color with full opacity
+def rep_fingerprint(rep):
+    """
+    Hashes everything a card is drawn from. It changes when the rep's record
+    is updated (updateDate_rep), when derived fields such as the tenure ranks
+    shift because other members came or went, when the rendered text changes
+    with CURRENT_YEAR, and when the layout, template or font changes.
 
+    Args:
+        rep (dict): Dictionary with rep info
+    Returns:
+        (str): sha1 hex digest of the rep's fields
+    """
+    try:
+        text = card_text(rep)
+    except KeyError:
+        text = None # Missing fields, the card itself will fail and stay out of the manifest
+    payload = {'layout': layout_stamp(), 'text': text, 'rep': rep}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def load_manifest():
+    """
+    Returns:
+        (dict): bioguideID -> fingerprint for every card already generated, empty if there's no manifest yet
+    """
+    try:
+        with open(MANIFEST_PATH, 'r') as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(manifest):
+    # Write then rename so an interrupted run can't leave a truncated manifest
+    with open(MANIFEST_PATH + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(MANIFEST_PATH + '.tmp', MANIFEST_PATH)
+
+
+# --- Function to create a single player card ---
+def card_text(rep_info):
+    """
+    Builds the text drawn on a rep's card. The stats message depends on
+    CURRENT_YEAR as well as the rep, e.g. "Up for re-election this year".
+
+    Args:
+        rep_info (dict): Dictionary with rep info
+    Returns:
+        (str): Name
+        (str): Header line
+        (str): Stats message
+    """
     chamber = rep_info['chamber']
     tenure = f"{rep_info['tenure_current_party']}/{rep_info['party_current_count']}"
     party = rep_info['partyName']
     state = rep_info['state']
     ###If using bonus data, load it here
 
-    # 4. Draw player name, centered
-    center_text(draw, text=rep_info['name'], font=font_name, offset=POSITIONS['name_pos'], text_color=text_color, center=(True,False))
-    
-    center_text(draw, text=f"{party} from {state}", font=font_labels, offset=POSITIONS['header_pos'], text_color=text_color, center=(True,False))
-    # 5. Draw stats and labels
-
     """FORMAT:
         House of
         Representatives
@@ -201,54 +431,158 @@ def create_card(rep_info, face_img):
 
     """
 
-    if (rep_info['endYear'] - 1 > date.today().year):
-        range = str(rep_info['startYear']) + " - Present"
-        message1 = f"{chamber}\n{range}\n{tenure} most tenured {party}\nUp for re-election in {str(rep_info['endYear']-1)}"
+    reelect = rep_info['endYear'] - 1
+    msg_template = MSG_TEMPLATES[(reelect > CURRENT_YEAR) - (reelect < CURRENT_YEAR) + 1]
+    message1 = msg_template.format(chamber=chamber, start=rep_info['startYear'], end=rep_info['endYear'],
+                                   tenure=tenure, party=party, reelect=reelect)
+    return rep_info['name'], f"{party} from {state}", message1
+
+
+def create_card(rep_info, face_img):
+    
+    # 1. Start from a fresh copy of the already decoded template
+    card = load_template().copy()
+
+    # 2. Open and process the player's face image
+    # Work in RGB, unless the face has transparency worth keeping
+    has_alpha = face_img.mode in ('RGBA', 'LA', 'PA') or 'transparency' in face_img.info
+    face_mode = 'RGBA' if has_alpha else 'RGB'
+    if face_img.mode != face_mode:
+        face_img = face_img.convert(face_mode)
+
+    #face_img = ImageOps.fit(face_img, PIC_MAX, method=0, bleed=0.0, centering=(0.5, 0.5))
+    # Resize to desired dimensions, bilinear is plenty for photo thumbnails this size
+    if face_img.size != PIC_MAX:
+        face_img = face_img.resize(PIC_MAX, Image.BILINEAR)
 
-    elif (rep_info['endYear'] - 1 < date.today().year):
-        range = f"{rep_info['startYear']} - {rep_info['endYear']}"
-        message1 = f"{chamber}\n{range}\n{tenure} most tenured {party}\n"
+    log.debug("Successfully resized face image")
 
+    # Paste the face image onto the card. Opaque faces are a straight copy,
+    # transparent ones are blended over the template rather than punching a hole in it
+    if has_alpha:
+        card.alpha_composite(face_img, dest=POSITIONS['pic_pos'])
     else:
-        range = str(rep_info['startYear']) + " - Present"
-        message1 = f"{chamber}\n{range}\n{tenure} most tenured {party}\nUp for re-election this year"
-        
-    draw_wrapped_text(draw, message1, font_labels, (690, 250), 300)
+        card.paste(face_img, box=POSITIONS['pic_pos'])
 
+    # 3. Prepare to draw text. It's drawn as coverage into a mask at TEXT_SCALE times the card size,
+    # then the downsampled mask paints text_color onto the card.
+    txt_mask = Image.new('L', TEXT_DIMS, 0)
+    draw = ImageDraw.Draw(txt_mask)
+    text_color = (0, 0, 0, 255) # Black color with full opacity
+    ink = 255 # Full coverage in the mask
+
+    name, header, message1 = card_text(rep_info)
+
+    # 4. Draw player name, centered
+    name_pos = tuple(v * TEXT_SCALE for v in POSITIONS['name_pos'])
+    center_text(draw, text=name, font=font_name, offset=name_pos, text_color=ink, center=(True,False), dims=TEXT_DIMS)
+    
+    header_pos = tuple(v * TEXT_SCALE for v in POSITIONS['header_pos'])
+    center_text(draw, text=header, font=font_labels, offset=header_pos, text_color=ink, center=(True,False), dims=TEXT_DIMS)
+    # 5. Draw stats and labels
+    draw_wrapped_text(draw, message1, font_labels, (690 * TEXT_SCALE, 250 * TEXT_SCALE), 300 * TEXT_SCALE,
+                      fill_color=ink, extra_padding_for_newline=10 * TEXT_SCALE)
+
+    # Downsample just the area with text on it (plus the Lanczos kernel's reach) and paint it onto the card
+    bbox = txt_mask.getbbox()
+    if bbox:
+        left, top = (max(0, v // TEXT_SCALE - 3) for v in bbox[:2])
+        right, bottom = (min(dim, -(-v // TEXT_SCALE) + 3) for v, dim in zip(bbox[2:], CARD_DIMS))
+        txt_mask = txt_mask.crop((left * TEXT_SCALE, top * TEXT_SCALE, right * TEXT_SCALE, bottom * TEXT_SCALE))
+        txt_mask = txt_mask.resize((right - left, bottom - top), Image.LANCZOS)
+        card.paste(text_color, (left, top, right, bottom), mask=txt_mask)
 
     # 6. Save the final card
-    replacements = str.maketrans({",": "", "\"": "", ".":"", " ":"_"})
-    output_filename = os.path.join(OUTPUT_DIR, \
-         f"{rep_info['name'].translate(replacements).lower()}_card.png")
-    card.save(output_filename)
-    print(f"Created card: {output_filename}")
+    output_filename = card_filename(rep_info)
+    card.save(output_filename, optimize=False, compress_level=PNG_COMPRESS_LEVEL)
+    log.debug("Created card: %s", output_filename)
 
 
-def gen_cards(congressmen_f, test_card=False):
+def _init_worker():
+    """
+    Runs once in each worker process so the template is decoded before the
+    first card rather than during it. Workers forked from gen_cards inherit
+    the parent's decoded copy, so this only decodes on spawn-style platforms.
+    """
+    load_template()
+
+
+def _process_rep(rep, face_bytes):
+    """
+    Worker entry point: decodes a single rep's photo and creates their card.
+
+    Args:
+        rep (dict): Dictionary with rep info
+        face_bytes (bytes): Prefetched image for rep['imageUrl'], None if missing
+    Returns:
+        (list): Issues found for this rep, to be merged into the error log
+    """
     error_log = []
-    #Load in the JSON
-    try: 
-        with open(congressmen_f, 'r') as f:
-            congressmen_json = json.load(f)
+    # One bad rep shouldn't stop the pool, it's reported and left out of the manifest instead
+    try:
+        face_img = pull_pic_from_web(rep, face_bytes, error_log)
+        create_card(rep, face_img)
     except Exception as e:
-        print("There is an issue with the congressmen.json. Quitting.")
-        return
+        log.warning("Couldn't create card for %s: %s", rep.get('name'), e)
+        error_log.append(f"{rep.get('name')}Card Creation")
+    return error_log
 
 
+def gen_cards(congressmen_f, test_card=False, use_cache=True):
+    error_log = []
+
     if not os.path.exists(TEMPLATE_PATH):
         print("\nExiting. Please set up your template and data, then run again.")
+        return
+
+    # --- Create output directory if it doesn't exist ---
+    os.makedirs(OUTPUT_DIR, exist_ok=True) #Make the cards directory
+    print(f"Using template: {TEMPLATE_PATH}")
+
+    manifest = load_manifest()
+    skipped = []
+
+    def needs_card(rep):
+        #A card made from identical data is already on disk, skip the download and the redraw
+        if manifest.get(rep.get('bioguideID')) == rep_fingerprint(rep) and os.path.exists(card_filename(rep)):
+            skipped.append(rep.get('bioguideID'))
+            return False
+        return True
+
+    #Stream in the JSON, so face downloads start on the first rep instead of after the whole parse
+    try: 
+        with open(congressmen_f, 'rb') as f:
+            reps = ijson.items(f, 'item')
+            if test_card:
+                print("Running in debug mode. Just printing one card.")
+                reps = itertools.islice(reps, 1)
+            elif use_cache:
+                reps = filter(needs_card, reps)
+            congressmen_json, images = prefetch_faces(reps, use_cache)
+    except (OSError, ijson.JSONError) as e:
+        print("There is an issue with the congressmen.json. Quitting.")
+        return
+
+    if test_card:
+        rep = congressmen_json[0]
+        face_img = pull_pic_from_web(rep, images.get(rep.get('imageUrl')), error_log)
+        create_card(rep, face_img)
     else:
-        # --- Create output directory if it doesn't exist ---
-        os.makedirs(OUTPUT_DIR, exist_ok=True) #Make the cards directory
-        print(f"Using template: {TEMPLATE_PATH}")
-        if test_card:
-            print("Running in debug mode. Just printing one card.")
-            rep = congressmen_json[0]
-            face_img = pull_pic_from_web(rep, error_log)
-            create_card(rep, face_img)
-        else:
-            for rep in congressmen_json:
-                face_img = pull_pic_from_web(rep, error_log)
-                create_card(rep, face_img)
-        print("\nPlayer card generation complete!")
-        print(f"Issue detected in the following congressmen, take a look: {error_log}")
\ No newline at end of file
+        if skipped:
+            print(f"Skipping {len(skipped)} congressmen whose cards are up to date")
+        face_bytes = [images.get(rep.get('imageUrl')) for rep in congressmen_json]
+        # Decode the template once here so forked workers start with it in memory
+        load_template()
+        # Each card is independent, so spread them across all cores
+        #Save the manifest even if the pool dies, so finished cards aren't redrawn next run
+        try:
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_worker) as ex:
+                for rep, rep_errors in zip(congressmen_json, ex.map(_process_rep, congressmen_json, face_bytes)):
+                    error_log.extend(rep_errors)
+                    #Cards with a problem (e.g. a placeholder face) are retried next run
+                    if not rep_errors:
+                        manifest[rep.get('bioguideID')] = rep_fingerprint(rep)
+        finally:
+            save_manifest(manifest)
+    print("\nPlayer card generation complete!")
+    print(f"Issue detected in the following congressmen, take a look: {error_log}")
\ No newline at end of file
@@ -7,9 +7,15 @@ Only needs to be run when there is a change in representatives
 
 # --- Phase 1: Web Scraping ---
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
 import time
+import logging
+import pandas as pd
+
+log = logging.getLogger(__name__)
 
 # --- Configuration ---
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY")
@@ -24,6 +30,17 @@ HEADERS = {
 }
 RATE_LIMIT_DELAY_SECONDS = 0.2 
 
+# One pooled session for every API call, so connections are reused across pages.
+# Rate limit and server errors are retried with backoff before giving up.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False # Hand the last response back so raise_for_status() reports it
+)))
+
 
 ########################################################
 
@@ -54,8 +71,8 @@ def get_bills_list(congress="119", bill_type="hr", limit=20, offset=0, sort="upd
     }
 
     try:
-        print(f"Querying: {BASE_URL}{endpoint} with params: {params}")
-        response = requests.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
+        log.debug("Querying: %s%s with params: %s", BASE_URL, endpoint, params)
+        response = SESSION.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
         response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
 
         data = response.json()
@@ -94,8 +111,8 @@ def get_bill_details(congress, bill_type, bill_number):
     }
 
     try:
-        print(f"Querying: {BASE_URL}{endpoint}")
-        response = requests.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
+        log.debug("Querying: %s%s", BASE_URL, endpoint)
+        response = SESSION.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
         response.raise_for_status()
 
         data = response.json()
@@ -153,15 +170,15 @@ def get_congress_members(congress=None, chamber=None, limit_per_page=250, max_me
 
     while True:
         try:
-            print(f"Fetching members from offset: {current_offset} (Limit: {limit_per_page})")
-            response = requests.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
+            log.debug("Fetching members from offset: %s (Limit: %s)", current_offset, limit_per_page)
+            response = SESSION.get(f"{BASE_URL}{endpoint}", headers=HEADERS, params=params)
             response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
 
             data = response.json()
 
             if 'members' in data and isinstance(data['members'], list):
                 new_members = data['members']
-                print(f"  - Got {len(new_members)} members from this page.")
+                log.debug("  - Got %d members from this page.", len(new_members))
 
                 # Add new members to the list
                 all_members_data.extend(new_members)
@@ -222,7 +239,7 @@ def flatten_user_terms(users_list):
     The input is a list, with each entry a dictionary (with a dictionary inside). 
     We want to flatten that dictionary inside.
     Flattens a list of user dictionaries, each with a nested 'terms' field,
-    into a single list of dictionaries where each row represents one term.
+    into a single dataframe where each row represents one term.
 
     FIELDS:
         'bioguideId'
@@ -240,35 +257,34 @@ def flatten_user_terms(users_list):
         'url': 'https://api.congress.gov/v3/member/C000243?format=json'}, 
 
     """
-    all_flattened_terms = []
-
-    for user_dict in users_list:
-        # Safely get the terms list, handling cases where it's missing or not a dict
-        terms_container = user_dict.get('terms', {})
-        terms_list = terms_container.get('item', [])
-        depiction_container = user_dict.get('depiction', {})
-
-
-        # Get the parent fields you want to keep in each row
-        parent_fields = {
-            'bioguideID': user_dict.get('bioguideId'),
-            'name': user_dict.get('name'),
-            'partyName': user_dict.get('partyName'),
-            'state': user_dict.get('state'),
-            #'updateDate_rep': user_dict.get('updateDate'),
-            'url': user_dict.get('url')
-        }
-        #add the depiction dictionary data
-        parent_fields.update(depiction_container)
-        
-        # Iterate through each term and create a new, flattened dictionary
-        for term in terms_list:
-            # Create a new dictionary for this row
-            flattened_row = parent_fields.copy()  # Start with the parent data
-            flattened_row.update(term)           # Add the nested term data
-            all_flattened_terms.append(flattened_row)
-    
-    return all_flattened_terms
+    # Members with no terms have nothing to flatten
+    users_list = [user_dict for user_dict in users_list if user_dict.get('terms', {}).get('item')]
+    if not users_list:
+        return pd.DataFrame()
+
+    # One row per member with depiction flattened out, then one row per term
+    members = pd.json_normalize(users_list).explode('terms.item', ignore_index=True)
+    terms = pd.json_normalize(members['terms.item'].tolist())
+
+    members = members.rename(columns={
+        'bioguideId': 'bioguideID',
+        'depiction.attribution': 'attribution',
+        'depiction.imageUrl': 'imageUrl',
+        'updateDate': 'updateDate_rep'
+    })
+    # Get the parent fields you want to keep in each row
+    parent_cols = ['bioguideID', 'name', 'partyName', 'state', 'updateDate_rep', 'url', 'attribution', 'imageUrl']
+    members = members.reindex(columns=parent_cols)
+
+    # Term fields win over parent fields of the same name
+    df = pd.concat([members.drop(columns=terms.columns, errors='ignore'), terms], axis=1)
+
+    # Current members have no endYear, keep the years as ints rather than NaN-padded floats
+    for col in ('startYear', 'endYear'):
+        if col in df:
+            df[col] = df[col].astype(pd.Int64Dtype())
+
+    return df
 
 
 
@@ -282,9 +298,14 @@ def flatten_user_terms(users_list):
 def gen_reps_json():
     members_dict = get_congress_members()
 
-    members_json = flatten_user_terms(members_dict)
-
-    with open('congressmen.json', 'w') as f:
-        json.dump(members_json, f, indent=2)
+    members_df = flatten_user_terms(members_dict)
 
+    members_df.to_json('congressmen.json', orient='records', indent=2)
     print("Wrote to file name congressmen.json")
+
+    #Typed, columnar copy for gen_xls, much quicker to load than the JSON
+    try:
+        members_df.to_parquet('congressmen.parquet', index=False)
+        print("Wrote to file name congressmen.parquet")
+    except ImportError:
+        print("pyarrow is not installed, skipping congressmen.parquet")
@@ -1,8 +1,16 @@
 # --- Phase 1: Web Scraping ---
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import os
 import json
 import time
+import logging
+import threading
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+
+log = logging.getLogger(__name__)
 
 # --- Configuration ---
 CONGRESS_API_KEY = os.getenv("CONGRESS_API_KEY")
@@ -17,6 +25,35 @@ HEADERS = {
 }
 RATE_LIMIT_DELAY_SECONDS = 0.2 
 
+# One pooled session for every API call, so connections are reused across pages.
+# Rate limit and server errors are retried with backoff before giving up.
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(max_retries=Retry(
+    total=5,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=["GET"],
+    raise_on_status=False # Hand the last response back so raise_for_status() reports it
+)))
+VOTE_FETCH_WORKERS = 8 # Roll call votes requested concurrently
+
+_rate_limit_lock = threading.Lock()
+_next_request_time = 0.0
+
+
+def wait_for_rate_limit():
+    """
+    Blocks until the calling thread may send a request. Request starts are spaced
+    RATE_LIMIT_DELAY_SECONDS apart across all threads, while the requests themselves overlap.
+    """
+    global _next_request_time
+    with _rate_limit_lock:
+        now = time.monotonic()
+        wait = _next_request_time - now
+        _next_request_time = max(now, _next_request_time) + RATE_LIMIT_DELAY_SECONDS
+    if wait > 0:
+        time.sleep(wait)
+
 
 
 
@@ -32,12 +69,13 @@ def get_house_vote_members(vote_number, congress=119, session=1, limit=250, offs
         offset (int): Starting record number for pagination.
 
     Returns:
-        list: A list of dictionaries, where each dictionary represents a member's
-              vote on this specific roll call, or an empty list if an error occurs.
-              This list will contain the individual member vote objects.
+        dict: The 'houseRollCallVoteMemberVotes' object for this roll call, whose
+              'results' list holds the individual member vote objects,
+              or None if an error occurs.
     """
     endpoint = f"house-vote/{congress}/{session}/{vote_number}/members"
     all_member_votes = []
+    data = {}
     current_offset = offset
 
     params = {
@@ -47,12 +85,13 @@ def get_house_vote_members(vote_number, congress=119, session=1, limit=250, offs
         "offset": current_offset
     }
 
-    print(f"Requesting members for vote: Congress {congress}, Session {session}, Vote #{vote_number}")
+    log.debug("Requesting members for vote: Congress %s, Session %s, Vote #%s", congress, session, vote_number)
 
     try:
         full_url = f"{BASE_URL}{endpoint}"
-        print(f"  - Querying: {full_url} with offset={params['offset']}")
-        response = requests.get(full_url, headers=HEADERS, params=params)
+        log.debug("  - Querying: %s with offset=%s", full_url, params['offset'])
+        wait_for_rate_limit()
+        response = SESSION.get(full_url, headers=HEADERS, params=params)
         response.raise_for_status() # Raise an exception for HTTP errors (4xx or 5xx)
 
         data = response.json()
@@ -65,10 +104,10 @@ def get_house_vote_members(vote_number, congress=119, session=1, limit=250, offs
             member_votes_on_page = member_votes_container.get('results', [])
 
         if not member_votes_on_page:
-            print("  - No more member votes found for this roll call or 'results' key missing/empty.")
+            log.debug("  - No more member votes found for this roll call or 'results' key missing/empty.")
 
         all_member_votes.extend(member_votes_on_page)
-        print(f"  - Fetched {len(member_votes_on_page)} member votes. Total: {len(all_member_votes)}")
+        log.debug("  - Fetched %d member votes. Total: %d", len(member_votes_on_page), len(all_member_votes))
 
     except requests.exceptions.HTTPError as e:
         print(f"HTTP Error for vote members: {e.response.status_code} - {e.response.text}")
@@ -94,15 +133,29 @@ def get_voting_record(max_records=100):
 
     Args: 
         max_records (int): Max number of measures to get voting records of, defaults to 100 for now but will change once working
+    Returns:
+        df: a pandas dataframe with one row per member vote
 
     """
-    full_voting_record = []
-    i = 1
+    frames = []
     #Modify this, can set this whole thing to True when running for all voting records
 
-    while i < max_records:
+    #Fetch the votes concurrently, wait_for_rate_limit keeps the request rate unchanged.
+    #Votes are requested a window at a time so nothing past the first missing vote is queued.
+    def fetch_votes():
+        with ThreadPoolExecutor(max_workers=VOTE_FETCH_WORKERS) as ex:
+            for start in range(1, max_records, VOTE_FETCH_WORKERS):
+                window = range(start, min(start + VOTE_FETCH_WORKERS, max_records))
+                records = list(ex.map(get_house_vote_members, window))
+                yield from zip(window, records)
+                if any(r is None for r in records):
+                    return
+
+    for i, vote_record_i in fetch_votes():
+        if vote_record_i is None:
+            print(f"Voting record {i} does not exist, quitting" )
+            break
         try: 
-            vote_record_i = get_house_vote_members(i)
             ###Postprocesses the vote_record_test JSON to flatten the "results" column
             parent_fields = {
                 'congress': vote_record_i.get('congress'),
@@ -116,25 +169,19 @@ def get_voting_record(max_records=100):
                 'voteQuestion': vote_record_i.get('voteQuestion'),
                 'voteType': vote_record_i.get('voteType')
             }
-            results_list = vote_record_i.get('results', [])
-
-            # Iterate through each term and create a new, flattened dictionary
-            for vote in results_list:
-                # Create a new dictionary for this row
-                flattened_row = parent_fields.copy()  # Start with the parent data
-                flattened_row.update(vote)           # Add the nested term data
-                full_voting_record.append(flattened_row)
-
-            time.sleep(RATE_LIMIT_DELAY_SECONDS)
-            i = i + 1
-        except requests.exceptions.HTTPError as e:
-            print(f"Voting record {i} does not exist, quitting" )
-            break
+            votes = pd.DataFrame(vote_record_i.get('results', []))
+
+            # Broadcast the parent data onto every vote row, parent columns first.
+            # Vote fields of the same name win, as they're more specific.
+            parent_fields = {k: v for k, v in parent_fields.items() if k not in votes}
+            frames.append(votes.assign(**parent_fields)[[*parent_fields, *votes.columns]])
         except Exception as e:
             print(f"An unhandled error occurred: {e}")
             break
 
-    return full_voting_record
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
 
 
 
@@ -142,11 +189,16 @@ def get_voting_record(max_records=100):
 
 #if __name__ == "__main__":
 def gen_voting_record_json():
-    voting_json = get_voting_record()
-
-    with open('voting_records.json', 'w') as f:
-        json.dump(voting_json, f, indent=2)
+    voting_df = get_voting_record()
 
+    voting_df.to_json('voting_records.json', orient='records', indent=2)
     print("Wrote to file name voting_records.json")
 
+    #Typed, columnar copy for gen_xls, much quicker to load than the JSON
+    try:
+        voting_df.to_parquet('voting_records.parquet', index=False)
+        print("Wrote to file name voting_records.parquet")
+    except ImportError:
+        print("pyarrow is not installed, skipping voting_records.parquet")
+
 
@@ -12,12 +12,14 @@ import os
 
 def json_to_df(file_name):
     """
-    Loads input JSON to use as dataframe.
+    Loads input JSON (or Parquet) to use as dataframe.
     Args: 
-        file_name: Input file, should point to a JSON formatted file.
+        file_name: Input file, should point to a JSON or .parquet formatted file.
     Returns: 
         df: a pandas dataframe
     """
+    if str(file_name).endswith('.parquet'):
+        return pd.read_parquet(file_name)
     return pd.read_json(file_name)
 
 
@@ -6,6 +6,7 @@ import gen_cards
 import sys
 import os
 import time
+import logging
 
 def get_yes_no_input(prompt):
     """
@@ -23,6 +24,13 @@ def get_yes_no_input(prompt):
 
 
 if __name__ == "__main__":
+    #Pass --no-cache to re-download every face image instead of reusing .cache/faces,
+    #and to redraw every card instead of skipping the ones the manifest says are up to date
+    use_cache = "--no-cache" not in sys.argv[1:]
+    #Pass --verbose to see per-card and per-request progress, otherwise only warnings are shown
+    logging.basicConfig(level=logging.DEBUG if "--verbose" in sys.argv[1:] else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+
     #Generate the representative json if it doesn't exist or if forcing override.
     if os.path.isfile('congressmen.json'):
         modification_timestamp = os.path.getmtime('congressmen.json')
@@ -59,8 +67,8 @@ if __name__ == "__main__":
     modify_reps.modify_reps("congressmen.json")
     if get_yes_no_input(f"Proceed with card creation on congressmen size above?"):
         print("Generating cards")
-        gen_cards.gen_cards('congressmen_mod.json')
+        gen_cards.gen_cards('congressmen_mod.json', use_cache=use_cache)
     else:
         print("Generating test card.")
-        gen_cards.gen_cards('congressmen_mod.json', test_card=True)
+        gen_cards.gen_cards('congressmen_mod.json', test_card=True, use_cache=use_cache)
         
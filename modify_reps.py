@@ -1,6 +1,8 @@
 import requests
 import os
 import json
+import orjson
+import ijson
 import time
 import pandas as pd
 import sys
@@ -11,78 +13,138 @@ import numpy as np
 
 ####################################################################################################
 
-def mod_json(list_of_dict):
-    """Modifies the input JSON in the following ways:
-        - Pads the "NA"s for endYear
-    """
-    for rep in list_of_dict:
-        #Pad the NAs for endYear
-        if 'endYear' not in rep:
-            if rep['chamber'].lower()=="Senate".lower():
-                rep.update({'endYear':rep['startYear']+6}) #6 year terms for senate
-            elif rep['chamber'].lower()=="House of Representatives".lower():
-                rep.update({'endYear':rep['startYear']+2}) #2 year terms for house
-    
-
-
 ############################################
 
 def update_endyear(df):
     #print(f"There are {len(df[df['endYear'].isna()])} NA endyears")
 
-    df['current_member'] = np.where(df['endYear'].isna(), "yes", "no")
-    #print(f"Added yes to {len(df[df['current_member']=="yes"])} members")
+    #Scan endYear for NAs once, the same mask marks current members and picks the rows to fill
+    na = df['endYear'].isna().to_numpy()
+    df['current_member'] = na
+    #print(f"Added {df['current_member'].sum()} current members")
 
     year = int(date.today().year)
 
-    #Replace endYear of HOR to startyear+2
-    df['endYear'] = np.where(
-        (df['endYear'].isna()) & (df['chamber'] == 'House of Representatives'),
-        year + 2 - (year - df['startYear'])%2,
-        df['endYear']
-    )
-    #Replace endYear of Senate to startyear+6
-    df['endYear'] = np.where(
-        (df['endYear'].isna()) & (df['chamber'] == 'Senate'),
-        year + 6 - (year - df['startYear'])%6,
-        df['endYear']
-    )
-
-    df['endYear'] = df['endYear'].astype(int)
+    #Fill the missing endYears in one pass: current terms end at the next election,
+    #every 2 years for the House and every 6 for the Senate
+    #Write straight into an int16 buffer, only the NA rows are computed
+    out = np.empty(len(df), dtype=np.int16)
+    out[~na] = df['endYear'].to_numpy()[~na]
+    #Only a few dozen distinct start years, so build a small [House, Senate] x startYear table
+    #of next-election years and gather from it instead of taking a modulus per row
+    senate = (df['chamber'] == 'Senate').to_numpy()[na].astype(np.intp)
+    sy = df['startYear'].to_numpy()[na]
+    if len(sy):
+        sy_min = int(sy.min())
+        delta = year - np.arange(sy_min, int(sy.max()) + 1)
+        table = np.stack([year + 2 - delta % 2, year + 6 - delta % 6]).astype(np.int16)
+        out[na] = table[senate, sy - sy_min]
+    df['endYear'] = out
 
     print(f"After processing, there are {len(df[df['endYear'].isna()])} na endYears")
     return df
 
 ############################################
 
-def add_tenure(df):
-    df['duration'] = df['endYear'] - df['startYear']
-
-    #tenure_all_time is across everyone, and across all time
-    df['tenure_all_time']  = df['duration'].rank(ascending=False, method='min').astype(int)
-    df['tenure_all_time_party'] = df.groupby('partyName')['duration'].rank(ascending=False, method='min').astype(int)
-
-    #tenure_current is just for current members, if they're not current members will be nan
-    df['tenure_current'] = np.where(df['current_member']=="yes", df.groupby('current_member')['duration'].rank(ascending=False,method='min'), np.nan)
-    df['tenure_current_party'] = np.where(df['current_member']=="yes", df.groupby(['current_member','partyName'])['duration'].rank(ascending=False,method='min'), np.nan)
-
-    df['tenure_current'] = df['tenure_current'].astype(pd.Int64Dtype())
-    df['tenure_current_party'] = df['tenure_current_party'].astype(pd.Int64Dtype())
+def min_rank_desc(values, groups=None):
+    """
+    Ranks values from largest to smallest within each group, with ties sharing
+    the lowest rank. Same result as pandas' rank(ascending=False, method='min'),
+    from one lexsort instead of a groupby.
+
+    Args:
+        values [np.ndarray]: Values to rank
+        groups [np.ndarray]: Integer group code for each value, optional. Everything is one group if None.
+    Returns:
+        np.ndarray: 1-based rank of each value within its group
+    """
+    n = len(values)
+    if n == 0:
+        return np.empty(0, dtype=np.int32)
+    if groups is None:
+        #One group: sort once, then the min rank is how many values are strictly larger, plus one
+        sorted_desc = -np.sort(values)[::-1]
+        return (np.searchsorted(sorted_desc, -values, side='left') + 1).astype(np.int32)
+
+    #Sort by group, then by value descending
+    order = np.lexsort((-values, groups))
+    g = groups[order]
+    v = values[order]
+
+    #A rank is the position of the first tie in its run, counted from the start of its group
+    new_group = np.r_[True, g[1:] != g[:-1]]
+    new_value = new_group | np.r_[True, v[1:] != v[:-1]]
+    pos = np.arange(n)
+    group_start = np.maximum.accumulate(np.where(new_group, pos, 0))
+    run_start = np.maximum.accumulate(np.where(new_value, pos, 0))
+
+    ranks = np.empty(n, dtype=np.int32)
+    ranks[order] = run_start - group_start + 1
+    return ranks
+
+
+def party_codes(df):
+    """
+    Dense integer code per partyName from a single factorize pass, for the grouped ranks and bincount counts.
+    A missing party gets its own code rather than -1, which bincount can't take.
 
-    df['party_all_time_count'] = df.groupby('partyName')['bioguideID'].transform('count')
-    df['party_current_count'] = df.groupby(['partyName','current_member'])['bioguideID'].transform('count')
+    Args:
+        df [pd.DataFrame]: Frame with a partyName column
+    Returns:
+        np.ndarray: Party code for each row
+    """
+    codes, _ = pd.factorize(df['partyName'], sort=False, use_na_sentinel=False)
+    return codes.astype(np.intp)
+
+
+def add_tenure_alltime(df):
+    """Ranks and counts over every member, past and present. Run before only_current."""
+    #Every derived column is computed as a plain array first, then added in one assign
+    #Terms are a few decades at most, so int8 holds the duration
+    dur = (df['endYear'].to_numpy() - df['startYear'].to_numpy()).astype(np.int8)
+    party = party_codes(df)
+
+    df = df.assign(
+        duration=dur,
+        #tenure_all_time is across everyone, and across all time
+        tenure_all_time=min_rank_desc(dur),
+        tenure_all_time_party=min_rank_desc(dur, party),
+        party_all_time_count=np.bincount(party)[party],
+    )
 
+    return df
 
+def add_tenure_current(df):
+    """Ranks and counts among current members only. Run after only_current, so every row is current."""
+    dur = df['duration'].to_numpy()
+    party = party_codes(df)
 
+    df = df.assign(
+        #Every row is current, so this is a plain rank with no grouping on current_member
+        tenure_current=min_rank_desc(dur),
+        tenure_current_party=min_rank_desc(dur, party),
+        party_current_count=np.bincount(party)[party],
+    )
 
     return df
 
 def only_current(df):
-    df = df[df['current_member']=="yes"]
+    df = df[df['current_member']]
     return df
 
 def normalize_name(df):
-    df['name'] = df['name'].str.split(', ').str[::-1].str.join(' ')
+    #"Last, First" -> "First Last" with a single split, no per-row list reversal
+    parts = df['name'].str.split(', ', n=1, expand=True)
+    if parts.shape[1] == 2:
+        first, last = parts[1], parts[0]
+
+        #Suffixes ("King, Angus S., Jr.") leave more commas in first, reverse those parts like before
+        multi = first.str.contains(', ', regex=False).fillna(False).astype(bool)
+        if multi.any():
+            first = first.mask(multi, first[multi].str.split(', ').str[::-1].str.join(' '))
+
+        #Names without a comma are left as they are
+        df['name'] = (first + ' ' + last).fillna(df['name'])
     return df
 
 ####################################################################################################
@@ -97,21 +159,49 @@ def modify_reps(input_json_f):
 
     """
 
-        #Load in the JSON
+        #Stream the JSON one record at a time into per-column lists, so the whole text
+        #and a list of dicts are never held next to the frame
+    columns = {}
     try: 
-        df = pd.read_json(input_json_f)
-    except Exception as e:
+        with open(input_json_f, 'rb') as f:
+            for i, rec in enumerate(ijson.items(f, 'item', use_float=True)):
+                for key, value in rec.items():
+                    col = columns.get(key)
+                    #Only a key seen for the first time needs padding for the earlier records
+                    if col is None:
+                        col = columns[key] = [None] * i
+                    col.append(value)
+                #Keep columns aligned when a record is missing a key
+                for col in columns.values():
+                    if len(col) <= i:
+                        col.append(None)
+    except (OSError, ijson.JSONError) as e:
         print("There is an issue with the congressmen.json. Quitting.")
         sys.exit()
+    df = pd.DataFrame(columns)
+    #Few distinct values, so compare and group on small integer codes rather than strings
+    df['partyName'] = df['partyName'].astype('category')
+    df['chamber'] = df['chamber'].astype('category')
+    #Years fit in int16
+    df['startYear'] = df['startYear'].astype(np.int16)
         
     df = update_endyear(df)
-    df = add_tenure(df)
-    df = normalize_name(df)
+    #Party ranks and counts span both chambers, so this stays one pass over the whole frame
+    #rather than being split by chamber across processes
+    df = add_tenure_alltime(df)
+    #Drop former members before the current-only work, rather than computing it for every row
     df = only_current(df)
+    df = add_tenure_current(df)
+    df = normalize_name(df)
+
+    #current_member is always true after only_current and duration only feeds the ranks, neither is read by gen_cards
+    df = df.drop(columns=['current_member', 'duration'], errors='ignore')
 
     print(f"Exporting {len(df)} congressmen")
 
-    df.to_json('congressmen_mod.json', indent=2, orient='records')
+    records = df.to_dict(orient='records')
+    with open('congressmen_mod.json', 'wb') as f:
+        f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
     print("Modified congressmen.json, wrote mods to congressmen_mod.json")
 